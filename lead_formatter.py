@@ -9,9 +9,60 @@
 #
 # Optional later:
 #   --mine-contacts-from-bio   (fills phone from bio only if phone is empty)
+#
+# Optional speedup: compile this module to a C extension with mypyc (type-checks clean),
+# then run it through an import so the compiled module is picked up:
+#   pip install mypy && mypyc --ignore-missing-imports lead_formatter.py
+#   python -c "import lead_formatter; lead_formatter.main()" ./scraper_outputs --out-csv leads.csv ...
+#
+# Or run under PyPy: orjson is optional (falling back to json), so
+# the script has no CPython-only dependencies and the per-row loop gets JIT-compiled:
+#   pypy3 lead_formatter.py ./scraper_outputs --out-csv leads.csv --out-jsonl leads.jsonl
+
+from __future__ import annotations
+
+import argparse, csv, functools, glob, itertools, json, mmap, os, re, sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+# orjson parses/serializes several times faster than stdlib json; fall back if it's missing.
+# _jsonl_line serializes one record as a newline-terminated JSONL line.
+_json_loads: Callable[[bytes | memoryview], Any]
+_jsonl_line: Callable[[Any], bytes]
+
+def _stdlib_json_line(obj: Any) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+try:
+    import orjson
 
-import argparse, csv, glob, json, os, re
-from urllib.parse import urlparse
+    def _orjson_loads(buf: bytes | memoryview) -> Any:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which Python scrapers emit and stdlib json accepts
+            return json.loads(bytes(buf))
+
+    def _orjson_line(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # e.g. ints beyond 64 bits (huge follower counts), which orjson refuses;
+            # compact separators keep the line in the same style as orjson's output
+            return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+    _json_loads = _orjson_loads
+    _jsonl_line = _orjson_line
+except ImportError:
+    _json_loads = lambda buf: json.loads(bytes(buf))
+    _jsonl_line = _stdlib_json_line
+
+# pyahocorasick matches any number of keywords in one pass over the text (optional).
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # -------------------- helpers --------------------
 
@@ -22,17 +73,34 @@ PLATFORM_HOSTS = {
     "linkedin": {"linkedin.com", "www.linkedin.com"},
     "youtube": {"youtube.com", "www.youtube.com", "youtu.be"},
 }
+_HOST_TO_PLATFORM = {h: p for p, hosts in PLATFORM_HOSTS.items() for h in hosts}
+_SCHEME_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-."
+_URL_LSTRIP_CHARS = "".join(map(chr, range(0x21)))  # C0 controls + space, as urlparse strips
 
 URL_RE = re.compile(r'(?i)\b((?:https?://|www\.)[a-z0-9\-._~%]+(?:/[^\s<>"\)]*)?)')
 EMAIL_RE = re.compile(r"(?i)\b[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}\b")
 PHONE_SPLIT_RE = re.compile(r"[;,]")
-
-def followers_to_int(x):
+_FOLLOWERS_RE = re.compile(r"^([\d\.]+)\s*([kmb])?$")
+_FOLLOWERS_MULT = {"k": 1000, "m": 1_000_000, "b": 1_000_000_000}
+_INDIA_PHONE_RE = re.compile(r'(?:(?:\+|00)?91[\s\-\(\)]*)?0?[6-9]\d{9}')  # India-style
+_INTL_PHONE_RE = re.compile(r'\+?\d(?:[\s\-\.\(\)]*\d){7,}')             # generic international
+_WS_RE = re.compile(r"\s+")
+# below this many keywords, `k in hay` per keyword beats an Aho-Corasick scan
+_AHOCORASICK_MIN_KEYWORDS = 16
+# JSONL lines are small; a 1 MiB buffer lets them reach the OS in few large writes
+_JSONL_BUFFER_SIZE = 1 << 20
+
+def followers_to_int(x) -> int:
     """Convert '405.1K' -> 405100, '2.3M' -> 2300000, '1200' -> 1200."""
     if x is None or x == "":
         return 0
     s = str(x).strip().lower().replace(",", "")
-    m = re.match(r"^([\d\.]+)\s*([kmb])?$", s)
+    # fast path: plain number with an optional k/m/b suffix, no regex
+    mult = _FOLLOWERS_MULT.get(s[-1:], 1)
+    digits = s[:-1].rstrip() if mult != 1 else s
+    if digits.replace(".", "", 1).isdecimal():
+        return int(float(digits) * mult)
+    m = _FOLLOWERS_RE.match(s)
     if not m:
         try:
             return int(float(s))
@@ -40,49 +108,58 @@ def followers_to_int(x):
             return 0
     num = float(m.group(1))
     suf = (m.group(2) or "").lower()
-    mult = {"k": 1e3, "m": 1e6, "b": 1e9}.get(suf, 1)
-    return int(num * mult)
+    return int(num * _FOLLOWERS_MULT.get(suf, 1))
 
-def canon_url(u: str) -> str:
-    """Canonicalize: https + host(lower) + path (no trailing slash)."""
+def _split_url(u: str) -> tuple[str, str]:
+    """
+    Cheap (netloc, path) split, mirroring urlparse for the URLs scrapers emit
+    (query/fragment dropped) without building a ParseResult.
+    """
+    u = u.lstrip(_URL_LSTRIP_CHARS)
+    # urlparse also deletes tab/CR/LF anywhere in the URL
+    u = u.replace("\t", "").replace("\r", "").replace("\n", "")
+    for sep in "?#":
+        i = u.find(sep)
+        if i != -1:
+            u = u[:i]
+    i = u.find(":")
+    if i > 0 and u[0].isascii() and u[0].isalpha() and not u[:i].lstrip(_SCHEME_CHARS):
+        u = u[i + 1:]
+    if u.startswith("//"):
+        netloc, sep, path = u[2:].partition("/")
+        return netloc, sep + path
+    return "", u
+
+def canon_url(u: str) -> tuple[str, str, str]:
+    """
+    Canonicalize: https + host(lower) + path (no trailing slash).
+    Returns (host, path, canonical_url) so callers can reuse the parsed parts.
+    """
     if not u:
-        return ""
-    try:
-        pu = urlparse(u)
-        host = (pu.netloc or "").lower()
-        path = (pu.path or "").rstrip("/")
-        if not host and pu.path:
-            # handle 'www.xyz.com/...' without scheme
-            host = pu.path.split("/")[0].lower()
-            path = "/" + "/".join(pu.path.split("/")[1:]).rstrip("/")
-        return f"https://{host}{path}"
-    except:
-        return u.strip()
-
-def detect_platform(url: str, fallback_platform: str = "") -> str:
-    """Infer platform from URL host, else use provided platform field."""
-    host = (urlparse(url).netloc or "").lower()
-    for platform, hosts in PLATFORM_HOSTS.items():
-        if host in hosts:
-            return platform
-    return (fallback_platform or "").lower()
-
-def extract_external_links_from_bio(bio: str):
+        return "", "", ""
+    netloc, raw_path = _split_url(u)
+    host = netloc.lower()
+    path = raw_path.rstrip("/")
+    if not host and raw_path:
+        # handle 'www.xyz.com/...' without scheme
+        host = raw_path.split("/")[0].lower()
+        path = "/" + "/".join(raw_path.split("/")[1:]).rstrip("/")
+    return host, path, f"https://{host}{path}"
+
+def detect_platform(host: str, fallback_platform: str = "") -> str:
+    """Infer platform from the (lowercased) URL host, else use provided platform field."""
+    return _HOST_TO_PLATFORM.get(host) or (fallback_platform or "").lower()
+
+def extract_external_links_from_bio(bio: str) -> list[str]:
     """Return a unique list of links found in the bio text."""
-    if not bio:
+    # every URL_RE match contains '://' or 'www.'; most bios have neither, so skip the regex scan
+    if not bio or ("://" not in bio and "www." not in bio.lower()):
         return []
-    urls = [m.group(1) for m in URL_RE.finditer(bio)]
-    # Normalize: prepend https:// to www. links with no scheme
-    normed = []
-    seen = set()
-    for u in urls:
-        if u.lower().startswith("www."):
-            u = "https://" + u
-        cu = u.strip()
-        if cu and cu not in seen:
-            seen.add(cu)
-            normed.append(cu)
-    return normed
+    urls = (m.group(1) for m in URL_RE.finditer(bio))
+    # Normalize: prepend https:// to www. links with no scheme; dict.fromkeys dedups in order
+    return list(dict.fromkeys(
+        ("https://" + u if u[:4].lower() == "www." else u).strip() for u in urls
+    ))
 
 def glean_location(item: dict) -> str:
     """
@@ -102,23 +179,29 @@ def glean_location(item: dict) -> str:
                 return ", ".join(parts)
     return ""
 
-def load_json_any(path: str):
+def load_json_any(path: str) -> list:
     """Load either a JSON array file or NDJSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        txt = f.read().strip()
-    if not txt:
-        return []
-    if txt.startswith("["):
-        return json.loads(txt)
-    # NDJSON
-    items = []
-    for line in txt.splitlines():
-        line = line.strip()
-        if line:
-            items.append(json.loads(line))
+    items: list = []
+    with open(path, "rb") as f:
+        # peek the first non-whitespace byte to tell an array from NDJSON
+        head = f.read(1)
+        while head.isspace():
+            head = f.read(1)
+        if not head:
+            return items
+        f.seek(-1, os.SEEK_CUR)
+        if head == b"[":
+            # parse straight from the mapped file instead of copying it into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+                return _json_loads(buf)
+        # NDJSON: parse line by line instead of holding the whole file as text
+        for line in f:
+            line = line.strip()
+            if line:
+                items.append(_json_loads(line))
     return items
 
-def _coerce_list(v):
+def _coerce_list(v) -> list[str]:
     if v is None:
         return []
     if isinstance(v, list):
@@ -128,14 +211,10 @@ def _coerce_list(v):
         return parts if parts else ([v.strip()] if v.strip() else [])
     return [str(v).strip()]
 
-def _unique(seq):
-    out, seen = [], set()
-    for s in seq:
-        if s not in seen:
-            seen.add(s); out.append(s)
-    return out
+def _unique(seq: list[str]) -> list[str]:
+    return list(dict.fromkeys(seq))
 
-def pull_email_and_phone(item: dict):
+def pull_email_and_phone(item: dict) -> tuple[str, str]:
     """
     Only uses fields present in JSON; DOES NOT mine bio for contacts (unless flag is enabled later).
     If nothing is present, returns empty strings.
@@ -160,43 +239,55 @@ def pull_email_and_phone(item: dict):
         if v:
             raw_phones += _coerce_list(v)
     # light cleanup
-    phones = _unique([re.sub(r"\s+", " ", p).strip() for p in raw_phones if p.strip()])
+    phones = _unique([_WS_RE.sub(" ", p).strip() for p in raw_phones if p.strip()])
     phone = phones[0] if phones else ""
 
     return email, phone
 
 # -------- optional phone mining from bio (off by default) --------
 
+def _clean_phone(m: re.Match) -> str:
+    """Collapse whitespace and trim separators off a phone regex match."""
+    return _WS_RE.sub(" ", m.group(0)).strip().strip(" -().")
+
 def mine_phones_from_bio(bio: str) -> list[str]:
     """
+    All phone numbers in a bio (public helper; the formatter itself only needs
+    the first one, see first_phone_from_bio).
     Conservative patterns to reduce false positives.
     - India-friendly mobiles (optional +91/0091/0 then 10 digits starting 6-9)
     - Generic international (at least 8 digits total, allows separators)
     """
     if not bio:
         return []
-    patterns = [
-        r'(?:(?:\+|00)?91[\s\-\(\)]*)?0?[6-9]\d{9}',  # India-style
-        r'\+?\d(?:[\s\-\.\(\)]*\d){7,}',             # generic international
-    ]
     seen, hits = set(), []
-    for pat in patterns:
-        for m in re.finditer(pat, bio):
-            raw = re.sub(r'\s+', ' ', m.group(0)).strip()
-            cleaned = raw.strip(" -().")
+    for pat in (_INDIA_PHONE_RE, _INTL_PHONE_RE):
+        for m in pat.finditer(bio):
+            cleaned = _clean_phone(m)
             if cleaned not in seen:
                 seen.add(cleaned)
                 hits.append(cleaned)
     return hits
 
+def first_phone_from_bio(bio: str) -> str:
+    """
+    Same as mine_phones_from_bio(bio)[0] ("" if none), but stops at the first hit:
+    the generic pattern only scans the bio when no India-style number is found.
+    """
+    if not bio:
+        return ""
+    m = _INDIA_PHONE_RE.search(bio) or _INTL_PHONE_RE.search(bio)
+    return _clean_phone(m) if m else ""
+
 # -------------------- normalization --------------------
 
 def normalize_item(item: dict, source_file: str) -> dict:
-    platform_raw = (item.get("platform") or "").lower()
+    # platform names repeat on every row; interning lets dedup/filter compare them by identity
+    platform_raw = sys.intern((item.get("platform") or "").lower())
     handle = item.get("username") or item.get("handle") or ""
     display_name = item.get("display_name") or item.get("name") or ""
     raw_url = item.get("url") or item.get("profile_url") or ""
-    canonical_url = canon_url(raw_url)
+    host, canonical_path, canonical_url = canon_url(raw_url)
 
     bio = item.get("bio") or item.get("biography") or item.get("description") or ""
     followers_raw = item.get("followers") or item.get("followers_count") or item.get("follower_count") or ""
@@ -205,7 +296,7 @@ def normalize_item(item: dict, source_file: str) -> dict:
     website = item.get("website") or item.get("external_url") or ""
 
     location = item.get("location") or glean_location(item)
-    social_media = detect_platform(canonical_url, platform_raw)
+    social_media = sys.intern(detect_platform(host, platform_raw))
     external_links = extract_external_links_from_bio(bio)
 
     email, phone = pull_email_and_phone(item)
@@ -213,11 +304,12 @@ def normalize_item(item: dict, source_file: str) -> dict:
     return {
         "social_media": social_media,
         "platform": platform_raw or social_media,
-        "handle": (handle or "").strip(),
-        "display_name": (display_name or "").strip(),
+        "handle": handle.strip(),
+        "display_name": display_name.strip(),
         "canonical_url": canonical_url,
+        "canonical_path": canonical_path,  # for matches_requirements; dropped before output
         "followers_int": followers_to_int(followers_raw),
-        "bio": (bio or "").strip(),
+        "bio": bio.strip(),
         "verified_bool": bool(verified),
         "business_bool": bool(business),
         "location": location,
@@ -230,8 +322,12 @@ def normalize_item(item: dict, source_file: str) -> dict:
     }
 
 def matches_requirements(lead: dict, cfg: dict) -> bool:
+    """
+    cfg should come from build_cfg: it expects keywords_any already lowercased and
+    include_platforms as a set, so neither is normalized again per lead.
+    """
     if cfg.get("profiles_only"):
-        if not lead["handle"] and not (urlparse(lead["canonical_url"]).path or "").strip("/"):
+        if not lead["handle"] and not lead["canonical_path"].strip("/"):
             return False
 
     include_platforms = cfg.get("include_platforms")
@@ -239,8 +335,7 @@ def matches_requirements(lead: dict, cfg: dict) -> bool:
         return False
 
     min_followers = cfg.get("min_followers", {})
-    mf = int(min_followers.get(lead["social_media"], 0))
-    if lead["followers_int"] < mf:
+    if lead["followers_int"] < min_followers.get(lead["social_media"], 0):
         return False
 
     if cfg.get("verified_only") and not lead["verified_bool"]:
@@ -248,14 +343,19 @@ def matches_requirements(lead: dict, cfg: dict) -> bool:
 
     keywords_any = cfg.get("keywords_any", [])
     if keywords_any:
-        hay = " ".join([lead["handle"], lead["display_name"], lead["bio"]]).lower()
-        if not any(k.lower() in hay for k in keywords_any):
+        # built once per lead (after the cheaper checks), shared by every keyword test
+        hay = f"{lead['handle']} {lead['display_name']} {lead['bio']}".lower()
+        automaton = cfg.get("keywords_automaton")
+        if automaton is not None:
+            if next(automaton.iter(hay), None) is None:
+                return False
+        elif not any(k in hay for k in keywords_any):
             return False
 
     return True
 
-def parse_min_followers(s: str) -> dict:
-    out = {}
+def parse_min_followers(s: str) -> dict[str, int]:
+    out: dict[str, int] = {}
     if not s:
         return out
     for pair in s.split(","):
@@ -269,6 +369,93 @@ def parse_min_followers(s: str) -> dict:
             out[k] = 0
     return out
 
+def build_keyword_automaton(keywords: list[str]):
+    """
+    Aho-Corasick automaton over the (lowercased) keywords, or None when pyahocorasick
+    is missing or the list is short enough that plain substring checks are faster.
+    """
+    if ahocorasick is None or len(keywords) < _AHOCORASICK_MIN_KEYWORDS:
+        return None
+    A = ahocorasick.Automaton()
+    for k in keywords:
+        A.add_word(k, k)
+    A.make_automaton()
+    return A
+
+def build_cfg(profiles_only: bool = False, include_platforms=(), min_followers=None,
+              verified_only: bool = False, keywords_any=()) -> dict:
+    """Build the filter config for matches_requirements, normalizing each option once."""
+    keywords = [k.strip().lower() for k in keywords_any if k.strip()]
+    return {
+        "profiles_only": profiles_only,
+        # interned like the leads' platform names, so the membership checks can match by identity
+        "include_platforms": {sys.intern(p.strip().lower()) for p in include_platforms if p.strip()},
+        "min_followers": {sys.intern(k.strip().lower()): v for k, v in (min_followers or {}).items()},
+        "verified_only": verified_only,
+        "keywords_any": keywords,
+        "keywords_automaton": build_keyword_automaton(keywords),
+    }
+
+def _load_and_normalize(fpath: str, mine_contacts_from_bio: bool = False):
+    """
+    Load & normalize one file (runs in a worker process).
+    Returns (leads, error); on error, leads holds what was normalized before the failure.
+    """
+    source_file = sys.intern(os.path.basename(fpath))
+    leads = []
+    try:
+        for it in load_json_any(fpath):
+            L = normalize_item(it, source_file=source_file)
+            # (optional) mine phone numbers from bio if phone is empty
+            if mine_contacts_from_bio and not L["phone"]:
+                L["phone"] = first_phone_from_bio(L["bio"])  # keep first match only
+            leads.append(L)
+    except Exception as e:
+        return leads, str(e)
+    return leads, None
+
+def iter_leads(files, mine_contacts_from_bio: bool = False, workers: int = 1):
+    """
+    Yield normalized leads in file order (bad files are skipped).
+    With workers > 1, files are loaded & normalized in parallel processes.
+    """
+    work = functools.partial(_load_and_normalize, mine_contacts_from_bio=mine_contacts_from_bio)
+    if workers > 1 and len(files) > 1:
+        yield from _drain(files, _reintern(_pooled_results(work, files, workers)))
+    else:
+        yield from _drain(files, map(work, files))
+
+def _pooled_results(work, files, workers: int):
+    """
+    work(f) for each file, in file order, run across a process pool. At most 2*workers
+    files are in flight, so finished results can't pile up ahead of the (serial) consumer.
+    """
+    workers = min(workers, len(files))  # don't fork more processes than there are files
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        todo = iter(files)
+        pending = deque(ex.submit(work, f) for f in itertools.islice(todo, 2 * workers))
+        while pending:
+            result = pending.popleft().result()
+            f = next(todo, None)  # refill before handing the result over
+            if f is not None:
+                pending.append(ex.submit(work, f))
+            yield result
+
+def _reintern(results):
+    """Unpickled leads carry fresh copies of the interned strings; intern them in this process too."""
+    for leads, err in results:
+        for L in leads:
+            L["social_media"] = sys.intern(L["social_media"])
+            L["platform"] = sys.intern(L["platform"])
+            L["source_file"] = sys.intern(L["source_file"])
+        yield leads, err
+
+def _drain(files, results):
+    for fpath, (leads, err) in zip(files, results):
+        yield from leads
+        if err is not None:
+            print(f"⚠️ Skipping {fpath}: {err}")
+
 # -------------------- main --------------------
 
 def main():
@@ -282,76 +469,60 @@ def main():
     ap.add_argument("--verified-only", action="store_true")
     ap.add_argument("--keywords-any", default="", help="comma list: travel,himachal")
     ap.add_argument("--mine-contacts-from-bio", action="store_true", help="fill phone from bio only if phone is empty")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes for load/normalize (1 = no multiprocessing)")
     args = ap.parse_args()
 
-    include_platforms = [p.strip().lower() for p in args.include_platforms.split(",") if p.strip()] if args.include_platforms else []
-    min_followers = parse_min_followers(args.min_followers)
-    keywords_any = [k.strip() for k in args.keywords_any.split(",") if k.strip()] if args.keywords_any else []
+    cfg = build_cfg(
+        profiles_only=args.profiles_only,
+        include_platforms=args.include_platforms.split(","),
+        min_followers=parse_min_followers(args.min_followers),
+        verified_only=args.verified_only,
+        keywords_any=args.keywords_any.split(","),
+    )
 
-    cfg = {
-        "profiles_only": args.profiles_only,
-        "include_platforms": include_platforms,
-        "min_followers": min_followers,
-        "verified_only": args.verified_only,
-        "keywords_any": keywords_any,
-    }
-
-    # 1) Load & normalize in one pass
     files = sorted(glob.glob(os.path.join(args.input_folder, "*.json")))
-    leads = []
-    for fpath in files:
-        try:
-            items = load_json_any(fpath)
-            for it in items:
-                leads.append(normalize_item(it, source_file=os.path.basename(fpath)))
-        except Exception as e:
-            print(f"⚠️ Skipping {fpath}: {e}")
-
-    # (optional) mine phone numbers from bio if phone is empty
-    if args.mine_contacts_from_bio:
-        for L in leads:
-            if not L.get("phone"):
-                nums = mine_phones_from_bio(L.get("bio", ""))
-                if nums:
-                    L["phone"] = nums[0]  # keep first match only
-
-    # 2) Deduplicate (by social_media + canonical_url, fallback handle; if both empty, keep row)
-    seen, uniq = set(), []
-    for idx, L in enumerate(leads):
-        if L["canonical_url"]:
-            key = (L["social_media"], L["canonical_url"])
-        elif L["handle"]:
-            key = (L["social_media"], "@"+L["handle"].lower())
-        else:
-            key = (L["social_media"], f"row-{idx}-{L['source_file']}")
-        if key in seen:
-            continue
-        seen.add(key)
-        uniq.append(L)
-
-    # 3) Filter
-    filtered = [L for L in uniq if matches_requirements(L, cfg)]
-
-    # 4) Write CSV
     csv_cols = [
         "social_media","platform","handle","display_name","canonical_url","followers_int",
         "bio","verified_bool","business_bool","location","website","email","phone",
         "external_links","linkedin_1","linkedin_2","linkedin_3","source_file"
     ]
-    with open(args.out_csv, "w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=csv_cols)
-        w.writeheader()
-        for L in filtered:
-            row = dict(L)
-            row["external_links"] = ";".join(L.get("external_links", []))
-            w.writerow({k: row.get(k, "") for k in csv_cols})
-
-    # 5) Write JSONL (keeps arrays like external_links)
-    with open(args.out_jsonl, "w", encoding="utf-8") as f:
-        for L in filtered:
-            f.write(json.dumps(L, ensure_ascii=False) + "\n")
-
-    print(f"✅ {len(filtered)} leads → {args.out_csv} and {args.out_jsonl}")
+
+    # Single streaming pass: load → normalize → dedup → filter → write.
+    # Besides the dedup key set, only a bounded window of per-file results is held in memory.
+    seen, n_written = set(), 0
+    with open(args.out_csv, "w", encoding="utf-8", newline="") as f_csv, \
+         open(args.out_jsonl, "wb", buffering=_JSONL_BUFFER_SIZE) as f_jsonl:
+        w = csv.writer(f_csv)
+        w.writerow(csv_cols)
+        for L in iter_leads(files, mine_contacts_from_bio=args.mine_contacts_from_bio, workers=args.workers):
+            # Deduplicate (by social_media + canonical_url, fallback handle; if both empty, keep row)
+            if L["canonical_url"]:
+                key = (L["social_media"], L["canonical_url"])
+            elif L["handle"]:
+                key = (L["social_media"], "@"+L["handle"].lower())
+            else:
+                key = None
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            if not matches_requirements(L, cfg):
+                continue
+
+            # CSV (same order as csv_cols)
+            w.writerow((
+                L["social_media"], L["platform"], L["handle"], L["display_name"], L["canonical_url"],
+                L["followers_int"], L["bio"], L["verified_bool"], L["business_bool"], L["location"],
+                L["website"], L["email"], L["phone"], ";".join(L["external_links"]),
+                L["linkedin_1"], L["linkedin_2"], L["linkedin_3"], L["source_file"],
+            ))
+            # JSONL (keeps arrays like external_links); canonical_path is filter-only, not output
+            del L["canonical_path"]
+            f_jsonl.write(_jsonl_line(L))
+            n_written += 1
+
+    print(f"✅ {n_written} leads → {args.out_csv} and {args.out_jsonl}")
 
 if __name__ == "__main__":
     main()